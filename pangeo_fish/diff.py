@@ -12,35 +12,60 @@ _diff_z_signatures = [
 ]
 
 
-@numba.guvectorize(_diff_z_signatures, "(z),(z),(),(o),(o),()->()", nopython=True)
+@numba.njit
+def _nearest_indices(sorted_values, values):
+    """Indices of the elements of a sorted array that are closest to the given values"""
+    positions = np.searchsorted(sorted_values, values)
+
+    lower = np.clip(positions - 1, 0, sorted_values.size - 1)
+    upper = np.clip(positions, 0, sorted_values.size - 1)
+
+    return np.where(
+        values - sorted_values[lower] <= sorted_values[upper] - values, lower, upper
+    )
+
+
+# compiled for the default cpu target: `diff_z` already maps this over dask chunks
+# from several threads, which numba's default threading layer does not support
+@numba.guvectorize(
+    _diff_z_signatures,
+    "(z),(z),(),(o),(o),()->()",
+    nopython=True,
+)
 def _diff_z(model_temp, model_depth, bottom, tag_temp, tag_depth, depth_thresh, result):
     if depth_thresh != 0 and bottom < np.max(tag_depth) * depth_thresh:
         result[0] = np.nan
         return
 
-    diff_temp = np.full_like(tag_depth, fill_value=np.nan)
     mask = ~np.isnan(model_depth) & ~np.isnan(model_temp)
     model_depth_ = np.absolute(model_depth[mask])
     if model_depth_.size == 0:
         result[0] = np.nan
         return
 
-    model_temp_ = model_temp[mask]
+    # sort the profile once so the nearest model depth can be found by bisection
+    order = np.argsort(model_depth_)
+    model_depth_ = model_depth_[order]
+    model_temp_ = model_temp[mask][order]
+
+    indices = _nearest_indices(model_depth_, tag_depth)
 
+    total = 0.0
+    count = 0
     for index in range(tag_depth.shape[0]):
         if not np.isnan(tag_depth[index]):
-            diff_depth = np.absolute(model_depth_ - tag_depth[index])
-
-            idx = np.argmin(diff_depth)
-
-            diff_temp[index] = tag_temp[index] - np.absolute(model_temp_[idx])
+            diff = tag_temp[index] - np.absolute(model_temp_[indices[index]])
+            if not np.isnan(diff):
+                total += diff
+                count += 1
 
-    result[0] = np.mean(diff_temp[~np.isnan(diff_temp)])
+    result[0] = total / count if count > 0 else np.nan
 
 
 def diff_z_numba(model_temp, model_depth, bottom, tag_temp, tag_depth, depth_thresh):
     with np.errstate(all="ignore"):
-        # TODO: figure out why the "invalid value encountered" warning is raised
+        # comparisons with missing values (e.g. nan tag depths) inside the kernel set
+        # the "invalid" floating point flag, which numpy reports after the gufunc loop
         return _diff_z(
             model_temp, model_depth, bottom, tag_temp, tag_depth, depth_thresh
         )
@@ -25,15 +25,29 @@ class EagerEstimator:
     sigma : float, optional
         The primary model parameter: the standard deviation of the distance
         per time unit traveled by the fish, in the same unit as the grid coordinates.
+    dtype : str or numpy.dtype, optional
+        The dtype of the state probabilities computed by :py:meth:`predict_proba` and
+        :py:meth:`decode`. By default, the dtype of the emission probabilities.
+        Single precision halves the memory of the states, but is only safe if the
+        emission probabilities are well within its range: values below about 1e-45
+        become 0, which for narrow emission distributions can empty the states. The
+        score is always computed with the dtype of the emission probabilities.
+
+    Notes
+    -----
+    The predictor (and thus the transition kernel) is constructed once per estimator
+    and reused by all methods. :py:meth:`set_params` returns a new instance, which
+    will construct a new predictor.
     """
 
     predictor_factory: callable
     sigma: float | None = None
+    dtype: str | np.dtype | None = None
 
     predictor: Predictor | None = field(default=None, init=False)
 
     def to_dict(self):
-        exclude = {"predictor_factory"}
+        exclude = {"predictor_factory", "predictor"}
 
         return {k: v for k, v in asdict(self).items() if k not in exclude}
 
@@ -47,31 +61,35 @@ class EagerEstimator:
         """
         return replace(self, **params)
 
-    def _score(self, X, *, spatial_dims=None, temporal_dims=None):
-        if self.sigma is None:
-            raise ValueError("unset sigma, cannot run the filter")
+    def _get_predictor(self):
+        if self.predictor is None:
+            self.predictor = self.predictor_factory(sigma=self.sigma)
 
+        return self.predictor
+
+    def _resolve_dims(self, X, *, spatial_dims=None, temporal_dims=None):
         if spatial_dims is None:
             spatial_dims = utils._detect_spatial_dims(X)
         if temporal_dims is None:
             temporal_dims = utils._detect_temporal_dims(X)
 
-        dims = temporal_dims + spatial_dims
+        return temporal_dims + spatial_dims
 
-        X_ = X.transpose(*dims)
+    def _score(self, X, *, spatial_dims=None, temporal_dims=None):
+        if self.sigma is None:
+            raise ValueError("unset sigma, cannot run the filter")
 
-        predictor: Predictor
-        if self.predictor is None:
-            predictor = self.predictor_factory(sigma=self.sigma)
-            self.predictor = predictor
-        else:
-            predictor = self.predictor
+        dims = self._resolve_dims(
+            X, spatial_dims=spatial_dims, temporal_dims=temporal_dims
+        )
+
+        X_ = X.transpose(*dims)
 
         value = score(
             emission=X_["pdf"].data,
             mask=X_["mask"].data,
             initial_probability=X_["initial"].data,
-            predictor=predictor,
+            predictor=self._get_predictor(),
         )
 
         return value if not np.isnan(value) else np.inf
@@ -80,41 +98,40 @@ class EagerEstimator:
         if self.sigma is None:
             raise ValueError("unset sigma, cannot run the filter")
 
-        if spatial_dims is None:
-            spatial_dims = utils._detect_spatial_dims(X)
-        if temporal_dims is None:
-            temporal_dims = utils._detect_temporal_dims(X)
+        dims = self._resolve_dims(
+            X, spatial_dims=spatial_dims, temporal_dims=temporal_dims
+        )
+        X_ = X.transpose(*dims)
 
-        predictor = self.predictor_factory(sigma=self.sigma)
-        filtered = forward(
-            emission=X["pdf"].data,
-            mask=X["mask"].data,
-            initial_probability=X["initial"].data,
-            predictor=predictor,
+        _, filtered = forward(
+            emission=X_["pdf"].data,
+            mask=X_["mask"].data,
+            initial_probability=X_["initial"].data,
+            predictor=self._get_predictor(),
+            dtype=self.dtype,
         )
-        return X["pdf"].copy(data=filtered)
+
+        # the filter works on the transposed data, so label the result accordingly
+        return X_["pdf"].copy(data=filtered).transpose(*X["pdf"].dims)
 
     def _forward_backward_algorithm(self, X, *, spatial_dims=None, temporal_dims=None):
         if self.sigma is None:
             raise ValueError("unset sigma, cannot run the filter")
 
-        if spatial_dims is None:
-            spatial_dims = utils._detect_spatial_dims(X)
-        if temporal_dims is None:
-            temporal_dims = utils._detect_temporal_dims(X)
-
-        dims = temporal_dims + spatial_dims
+        dims = self._resolve_dims(
+            X, spatial_dims=spatial_dims, temporal_dims=temporal_dims
+        )
         X_ = X.transpose(*dims)
 
-        predictor = self.predictor_factory(sigma=self.sigma)
         filtered = forward_backward(
             emission=X_["pdf"].data,
             mask=X_["mask"].data,
             initial_probability=X_["initial"].data,
-            predictor=predictor,
+            predictor=self._get_predictor(),
+            dtype=self.dtype,
         )
 
-        return X["pdf"].copy(data=filtered)
+        return X_["pdf"].copy(data=filtered).transpose(*X["pdf"].dims)
 
     def predict_proba(self, X, *, spatial_dims=None, temporal_dims=None):
         """Predict the state probabilities
@@ -1,3 +1,4 @@
+import itertools
 import warnings
 
 import dask
@@ -6,6 +7,29 @@ import numpy as np
 import zarr  # noqa: F401
 
 
+def _iter_timesteps(arr):
+    """Iterate over the first axis of an array
+
+    Dask arrays are loaded one chunk along the first axis at a time instead of
+    computing a separate graph for every time step.
+    """
+    if not isinstance(arr, da.Array):
+        yield from arr
+        return
+
+    boundaries = itertools.pairwise(np.cumsum((0,) + arr.chunks[0]))
+    for start, stop in boundaries:
+        [block] = dask.compute(arr[start:stop, ...])
+        yield from block
+
+
+def _state_dtype(dtype, emission, initial_probability):
+    if dtype is not None:
+        return np.dtype(dtype)
+
+    return np.result_type(emission.dtype, initial_probability.dtype)
+
+
 def score(emission, predictor, initial_probability, mask=None):
     """Score of a single pass (forwards) of the spatial HMM filter
 
@@ -27,9 +51,8 @@ def score(emission, predictor, initial_probability, mask=None):
     score : float
         A measure of how well the model parameter fits the data.
     """
-    n_max = emission.shape[0]
-
-    normalizations = []
+    # scaling factors of the filter, accumulated in double precision
+    normalizations = np.empty(emission.shape[0], dtype="float64")
 
     initial, mask = dask.compute(initial_probability, mask)
     if isinstance(initial_probability, da.Array):
@@ -39,31 +62,31 @@ def score(emission, predictor, initial_probability, mask=None):
     if isinstance(mask, da.Array):
         mask = dask.compute(mask)
 
-    normalizations.append(np.sum(initial * dask.compute(emission[0, ...])[0]))
+    timesteps = _iter_timesteps(emission)
+
+    normalizations[0] = np.sum(initial * next(timesteps), dtype="float64")
     previous = initial
 
-    for index in range(1, n_max):
+    for index, emission_ in enumerate(timesteps, start=1):
         prediction = predictor.predict(previous, mask=mask)
-        updated = prediction * dask.compute(emission[index, ...])[0]
+        updated = prediction * emission_
 
-        normalization_factor = np.sum(updated)
+        normalization_factor = np.sum(updated, dtype="float64")
         if normalization_factor == 0:
             warnings.warn(
                 f"Empty product of the prediction with the true distribution at step {index+1}.",
                 RuntimeWarning,
             )
             return 1e6
-        normalizations.append(normalization_factor)
-        normalized = updated / normalizations[index]
-
-        previous = normalized
+        normalizations[index] = normalization_factor
+        updated /= normalization_factor
 
-    normalizations_ = np.stack(normalizations, axis=0)
+        previous = updated
 
-    return -np.sum(np.log(normalizations_))
+    return -np.sum(np.log(normalizations))
 
 
-def forward(emission, predictor, initial_probability, mask=None):
+def forward(emission, predictor, initial_probability, mask=None, dtype=None):
     """Single pass (forwards) of the spatial HMM filter
 
     Parameters
@@ -76,13 +99,18 @@ def forward(emission, predictor, initial_probability, mask=None):
         The probability of the first hidden state
     mask : array-like, optional
         A mask to apply after each step. No shadowing yet.
+    dtype : dtype-like, optional
+        The dtype of the state probabilities. By default, the common dtype of the
+        emission and initial probabilities. The emission probabilities are cast to
+        this dtype, so in single precision values below about 1e-45 become 0.
 
     Returns
     -------
     score : float
         A measure of how well the model parameter fits the data.
     """
-    n_max = emission.shape[0]
+    dtype = _state_dtype(dtype, emission, initial_probability)
+    initial_probability = np.asarray(initial_probability, dtype=dtype)
 
     predictions = []
     states = []
@@ -90,14 +118,16 @@ def forward(emission, predictor, initial_probability, mask=None):
     predictions.append(initial_probability)
     states.append(initial_probability)
 
-    for index in range(1, n_max):
+    timesteps = itertools.islice(_iter_timesteps(emission), 1, None)
+    for index, emission_ in enumerate(timesteps, start=1):
         prediction = predictor.predict(states[index - 1], mask=mask)
+        prediction = prediction.astype(dtype, copy=False)
         predictions.append(prediction)
 
-        updated = prediction * emission[index, ...]
+        updated = prediction * emission_.astype(dtype, copy=False)
 
-        normalized = updated / np.sum(updated)
-        states.append(normalized)
+        updated /= np.sum(updated, dtype="float64")
+        states.append(updated)
 
     return np.stack(predictions, axis=0), np.stack(states, axis=0)
 
@@ -124,7 +154,7 @@ def backward(states, predictions, predictor, mask=None):
     )
 
 
-def forward_backward(emission, predictor, initial_probability, mask=None):
+def forward_backward(emission, predictor, initial_probability, mask=None, dtype=None):
     """Double pass (forwards and backwards) of the spatial HMM filter
 
     Parameters
@@ -139,26 +169,57 @@ def forward_backward(emission, predictor, initial_probability, mask=None):
         The probability of the last hidden state
     mask : array-like, optional
         A mask to apply after each step. No shadowing yet.
+    dtype : dtype-like, optional
+        The dtype of the state probabilities. By default, the common dtype of the
+        emission and initial probabilities. The emission probabilities are cast to
+        this dtype, so in single precision values below about 1e-45 become 0.
 
     Returns
     -------
-    score : float
-        A measure of how well the model parameter fits the data.
+    states : numpy.ndarray
+        The smoothed state probabilities.
+
+    Notes
+    -----
+    The forward and backward passes share two preallocated buffers: the backward
+    pass overwrites the filtered states in place with the smoothed states, and the
+    forward predictions with the ratios propagated backwards.
     """
+    if isinstance(initial_probability, da.Array):
+        [initial_probability] = dask.compute(initial_probability)
+    if isinstance(mask, da.Array):
+        [mask] = dask.compute(mask)
 
-    forward_predictions, forward_states = forward(
-        emission=emission,
-        predictor=predictor,
-        initial_probability=initial_probability,
-        mask=mask,
-    )
-    backwards_predictions, backwards_states = backward(
-        states=forward_states,
-        predictions=forward_predictions,
-        predictor=predictor,
-        mask=mask,
-    )
-    return backwards_states
+    n_max = emission.shape[0]
+    dtype = _state_dtype(dtype, emission, initial_probability)
+
+    states = np.empty(emission.shape, dtype=dtype)
+    predictions = np.empty(emission.shape, dtype=dtype)
+
+    predictions[0, ...] = initial_probability
+    states[0, ...] = initial_probability
+
+    timesteps = itertools.islice(_iter_timesteps(emission), 1, None)
+    for index, emission_ in enumerate(timesteps, start=1):
+        predictions[index, ...] = predictor.predict(states[index - 1, ...], mask=mask)
+
+        updated = states[index, ...]
+        np.multiply(predictions[index, ...], emission_, out=updated)
+        updated /= np.sum(updated, dtype="float64")
+
+    for index in range(n_max - 2, -1, -1):
+        # where the prediction is 0 the state is 0 as well, so the ratio stays 0
+        ratio = predictions[index + 1, ...]
+        np.divide(states[index + 1, ...], ratio, out=ratio, where=ratio > 0)
+
+        # the scale of the backward prediction cancels out in the normalization below
+        backward_prediction = predictor.predict(ratio, mask=None)
+
+        updated = states[index, ...]
+        updated *= backward_prediction
+        updated /= np.sum(updated, dtype="float64")
+
+    return states
 
 
 def copy_coords_of(arr, source, dest):
@@ -25,6 +25,19 @@ def gaussian_filter(X, sigma, **kwargs):
         return scipy.ndimage.gaussian_filter(X, sigma=sigma, **kwargs)
 
 
+def _gaussian_kernel1d(sigma, truncate):
+    """Normalized 1D gaussian weights, as used by ``scipy.ndimage.gaussian_filter``"""
+    if sigma <= 1e-15:
+        # scipy skips the filter in this case
+        return np.ones(1)
+
+    radius = int(truncate * sigma + 0.5)
+    x = np.arange(-radius, radius + 1)
+    weights = np.exp(-0.5 / sigma**2 * x**2)
+
+    return weights / weights.sum()
+
+
 @dataclass
 class Predictor:
     def predict(self, X, *, mask=None):
@@ -39,13 +52,32 @@ class Gaussian2DCartesian(Predictor):
         default_factory=lambda: {"mode": "constant", "cval": 0}
     )
 
+    def __post_init__(self):
+        self.weights = _gaussian_kernel1d(self.sigma, self.truncate)
+
     def predict(self, X, *, mask=None):
-        filtered = gaussian_filter(X, sigma=self.sigma, **self.filter_kwargs)
+        if isinstance(X, da.Array):
+            filtered = gaussian_filter(
+                X, sigma=self.sigma, truncate=self.truncate, **self.filter_kwargs
+            )
+
+            return filtered if mask is None else np.where(mask, filtered, 0)
+
+        # the isotropic gaussian is separable: filter along one axis at a time
+        filtered = X
+        for axis in range(X.ndim):
+            filtered = scipy.ndimage.correlate1d(
+                filtered, self.weights, axis=axis, **self.filter_kwargs
+            )
 
         if mask is None:
             return filtered
-
-        return np.where(mask, filtered, 0)
+        elif isinstance(mask, np.ndarray):
+            # `filtered` is a new array, so the masked cells can be zeroed in place
+            np.copyto(filtered, 0, where=np.logical_not(mask))
+            return filtered
+        else:
+            return np.where(mask, filtered, 0)
 
 
 @dataclass
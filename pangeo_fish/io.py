@@ -1,5 +1,7 @@
 """Module for managing I/O operations."""
 
+import concurrent.futures
+import functools
 import json
 import warnings
 
@@ -22,19 +24,54 @@ def tz_convert(df, timezones):
     timezones : mapping of str to str
         The time zones to convert to per column.
     """
-    new_columns = {
-        column: pd.Index(df[column]).tz_convert(tz) for column, tz in timezones.items()
-    }
+    converted = df.copy(deep=False)
+    for column, tz in timezones.items():
+        converted[column] = converted[column].dt.tz_convert(tz)
+
+    return converted
+
+
+def _assign_dynamic_depth(ds):
+    """Add the depth and the bathymetry, corrected by the sea surface height"""
+    attrs = {"units": "m", "positive": "down"}
+
+    # both share the (lazy) sea surface height, so it is only read once when computing
+    return ds.assign(
+        {
+            "dynamic_depth": (ds["depth"] + ds["XE"]).assign_attrs(attrs),
+            "dynamic_bathymetry": (ds["H0"] + ds["XE"]).assign_attrs(attrs),
+        }
+    )
+
+
+# the resolution of dates parsed by pandas' own csv parser, which depends on the version
+_time_unit = pd.to_datetime(["1970-01-01"]).unit
+
+
+def _read_csv(f, time_columns, index_col):
+    """Read a csv file with timezone-aware time columns
+
+    The file is parsed by arrow, falling back to pandas' own parser for files arrow
+    rejects (like files containing whitespace-only lines). The time columns are
+    converted to timezone-naive UTC, with the resolution of pandas' own parser.
+    """
+    try:
+        df = pd.read_csv(f, engine="pyarrow", parse_dates=time_columns)
+    except pd.errors.ParserError:
+        f.seek(0)
+        df = pd.read_csv(f, parse_dates=time_columns)
 
-    return df.assign(**new_columns)
+    converted = tz_convert(df, dict.fromkeys(time_columns))
+    for column in time_columns:
+        converted[column] = converted[column].dt.as_unit(_time_unit)
+
+    return converted.set_index(index_col)
 
 
 def read_stations(f):
-    return pd.read_csv(
-        f,
-        parse_dates=["deploy_time", "recover_time"],
-        index_col="deployment_id",
-    ).pipe(tz_convert, {"deploy_time": None, "recover_time": None})
+    return _read_csv(
+        f, time_columns=["deploy_time", "recover_time"], index_col="deployment_id"
+    )
 
 
 def open_tag(root, name, storage_options=None):
@@ -62,36 +99,57 @@ def open_tag(root, name, storage_options=None):
     else:
         mapper = root
 
-    dst = pd.read_csv(
-        mapper.dirfs.open(f"{name}/dst.csv"), parse_dates=["time"], index_col="time"
-    ).tz_convert(None)
-
-    tagging_events = pd.read_csv(
-        mapper.dirfs.open(f"{name}/tagging_events.csv"),
-        parse_dates=["time"],
-        index_col="event_name",
-    ).pipe(tz_convert, {"time": None})
-
-    metadata = json.load(mapper.dirfs.open(f"{name}/metadata.json"))
+    # open the optional files directly instead of checking for them first: this saves
+    # a request per file, and does not require directory listings (which some servers
+    # and buckets don't allow)
+    fs = mapper.dirfs
+
+    def read_dst():
+        with fs.open(f"{name}/dst.csv") as f:
+            return _read_csv(f, time_columns=["time"], index_col="time")
+
+    def read_tagging_events():
+        with fs.open(f"{name}/tagging_events.csv") as f:
+            return _read_csv(f, time_columns=["time"], index_col="event_name")
+
+    def read_metadata():
+        with fs.open(f"{name}/metadata.json") as f:
+            return json.load(f)
+
+    def read_acoustic():
+        with fs.open(f"{name}/acoustic.csv") as f:
+            return _read_csv(f, time_columns=["time"], index_col="time")
+
+    def read_stations_csv():
+        with fs.open("stations.csv") as f:
+            return read_stations(f)
+
+    def optional(reader):
+        try:
+            return reader()
+        except FileNotFoundError:
+            return None
+
+    # the files are independent, so overlap the (possibly remote) reads
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        dst = executor.submit(read_dst)
+        tagging_events = executor.submit(read_tagging_events)
+        metadata = executor.submit(read_metadata)
+        stations = executor.submit(optional, read_stations_csv)
+        acoustic = executor.submit(optional, read_acoustic)
 
     mapping = {
-        "/": xr.Dataset(attrs=metadata),
-        "dst": dst.to_xarray(),
-        "tagging_events": tagging_events.to_xarray(),
+        "/": xr.Dataset(attrs=metadata.result()),
+        "dst": dst.result().to_xarray(),
+        "tagging_events": tagging_events.result().to_xarray(),
     }
-    if mapper.dirfs.exists("stations.csv"):
-        stations = read_stations(mapper.dirfs.open("stations.csv"))
-        if len(stations) > 0:
-            mapping["stations"] = stations.to_xarray()
-
-    if mapper.dirfs.exists(f"{name}/acoustic.csv"):
-        acoustic = pd.read_csv(
-            mapper.dirfs.open(f"{name}/acoustic.csv"),
-            parse_dates=["time"],
-            index_col="time",
-        ).tz_convert(None)
-        if len(acoustic) > 0:
-            mapping["acoustic"] = acoustic.to_xarray()
+    stations = stations.result()
+    if stations is not None and len(stations) > 0:
+        mapping["stations"] = stations.to_xarray()
+
+    acoustic = acoustic.result()
+    if acoustic is not None and len(acoustic) > 0:
+        mapping["acoustic"] = acoustic.to_xarray()
 
     return xr.DataTree.from_dict(mapping)
 
@@ -118,6 +176,13 @@ def open_copernicus_catalog(cat, chunks=None):
     if chunks is None:
         chunks = {"lat": -1, "lon": -1, "depth": 11, "time": 8}
 
+    # open once, the bathymetry and the mask are in the same dataset
+    mdt = (
+        cat.data_tmp(type="mdt", chunks=chunks)
+        .to_dask()
+        .rename({"latitude": "lat", "longitude": "lon"})
+    )
+
     ds = (
         cat.data(type="TEM", chunks=chunks)
         .to_dask()
@@ -127,31 +192,12 @@ def open_copernicus_catalog(cat, chunks=None):
         .assign(
             {
                 "XE": cat.data(type="SSH", chunks=chunks).to_dask().get("zos"),
-                "H0": (
-                    cat.data_tmp(type="mdt", chunks=chunks)
-                    .to_dask()
-                    .get("deptho")
-                    .rename({"latitude": "lat", "longitude": "lon"})
-                ),
-                "mask": (
-                    cat.data_tmp(type="mdt", chunks=chunks)
-                    .to_dask()
-                    .get("mask")
-                    .rename({"latitude": "lat", "longitude": "lon"})
-                ),
+                "H0": mdt["deptho"],
+                "mask": mdt["mask"],
             }
         )
         # TODO: figure out the definition of `depth` and if there are standard names for these
-        .assign(
-            {
-                "dynamic_depth": lambda ds: (ds["depth"] + ds["XE"]).assign_attrs(
-                    {"units": "m", "positive": "down"}
-                ),
-                "dynamic_bathymetry": lambda ds: (ds["H0"] + ds["XE"]).assign_attrs(
-                    {"units": "m", "positive": "down"}
-                ),
-            }
-        )
+        .pipe(_assign_dynamic_depth)
         .pipe(broadcast_variables, {"lat": "latitude", "lon": "longitude"})
     )
 
@@ -232,16 +278,7 @@ def prepare_dataset(dataset, chunks=None, bbox=None, names=None):
         dataset.chunk(chunks=chunks)
         .rename(names)
         # .assign_coords({"time": lambda ds: ds["time"].astype("datetime64[ns]")}) # useless?
-        .assign(
-            {
-                "dynamic_depth": lambda ds: (ds["depth"] + ds["XE"]).assign_attrs(
-                    {"units": "m", "positive": "down"}
-                ),
-                "dynamic_bathymetry": lambda ds: (ds["H0"] + ds["XE"]).assign_attrs(
-                    {"units": "m", "positive": "down"}
-                ),
-            }
-        )
+        .pipe(_assign_dynamic_depth)
         .pipe(broadcast_variables, {"lat": "latitude", "lon": "longitude"})  # useless?
     )
     return ds
@@ -263,12 +300,23 @@ def save_trajectories(traj, root, storage_options=None, format="geoparquet"):
 
     trajectories = getattr(traj, "trajectories", [traj])
 
-    for traj in trajectories:
+    def save(traj):
         path = f"{root}/{traj.id}.parquet"
 
         df = converter(traj.df)
         df.to_parquet(path, storage_options=storage_options)
 
+    if len(trajectories) <= 1:
+        for traj in trajectories:
+            save(traj)
+        return
+
+    # the writes are independent, so overlap them (mostly useful for remote storage)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(16, len(trajectories))
+    ) as executor:
+        list(executor.map(save, trajectories))
+
 
 def read_trajectories(names, root, storage_options=None, format="geoparquet"):
     """Read trajectories from disk
@@ -288,7 +336,7 @@ def read_trajectories(names, root, storage_options=None, format="geoparquet"):
         The read tracks as a collection.
     """
 
-    def read_geoparquet(root, name, storage_options):
+    def read_geoparquet(root, name):
         path = f"{root}/{name}.parquet"
 
         gdf = gpd.read_parquet(path, storage_options=storage_options)
@@ -311,7 +359,13 @@ def read_trajectories(names, root, storage_options=None, format="geoparquet"):
     if reader is None:
         raise ValueError(f"unknown format: {format}")
 
-    return mpd.TrajectoryCollection([reader(root, name) for name in names])
+    # the reads are independent, so overlap them (mostly useful for remote storage)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(16, len(names)))
+    ) as executor:
+        trajectories = list(executor.map(lambda name: reader(root, name), names))
+
+    return mpd.TrajectoryCollection(trajectories)
 
 
 def save_html_hvplot(plot, filepath, storage_options=None):
@@ -356,6 +410,26 @@ def save_html_hvplot(plot, filepath, storage_options=None):
         return False, f"Error occurred: {str(e)}"
 
 
+@functools.lru_cache(maxsize=32)
+def _copernicus_asset_hrefs(collection):
+    """Search the STAC catalog for the asset urls of a Copernicus Marine collection
+
+    The search is a network request, so the result is cached (as nested tuples of
+    ``(item_id, ((asset_key, href), ...))``).
+    """
+    import pystac_client
+
+    client = pystac_client.Client.open("https://keewis-copernicus-marine.hf.space")
+    result = client.search(
+        collections=[collection],
+    ).item_collection()
+
+    return tuple(
+        (item.id, tuple((key, asset.href) for key, asset in item.assets.items()))
+        for item in result.items
+    )
+
+
 def open_copernicus_zarr(
     model="GLOBAL_ANALYSISFORECAST_PHY_001_024",
     format="geoChunked",
@@ -461,24 +535,22 @@ def open_copernicus_zarr(
     ##TODO, Here in the stac catalogue, we will need to add the data copied in GFTS
     #    import copernicusmarine as copernicusmarine
 
-    import pystac_client
-
-    client = pystac_client.Client.open("https://keewis-copernicus-marine.hf.space")
-    result = client.search(
-        collections=[model],
-    ).item_collection()
-    var = {item.id: item for item in result.items}
+    var = {item_id: dict(assets) for item_id, assets in _copernicus_asset_hrefs(model)}
 
     # Open necessary datasets
+    # (some models store thetao and zos in the same dataset, so open each store once)
+    opened = {}
 
-    asset = var[name[model]["thetao"][freq]].assets["geoChunked"]
-    thetao = xr.open_dataset(asset.href, engine="zarr", chunks={}).thetao.to_dataset()
+    def open_asset(item_id, kind):
+        href = var[item_id][kind]
+        if href not in opened:
+            opened[href] = xr.open_dataset(href, engine="zarr", chunks={})
 
-    asset = var[name[model]["zos"][freq]].assets["geoChunked"]
-    zos = xr.open_dataset(asset.href, engine="zarr", chunks={}).zos
+        return opened[href]
 
-    asset = var[name[model]["deptho"]].assets["static"]
-    deptho = xr.open_dataset(asset.href, engine="zarr", chunks={}).deptho
+    thetao = open_asset(name[model]["thetao"][freq], "geoChunked").thetao.to_dataset()
+    zos = open_asset(name[model]["zos"][freq], "geoChunked").zos
+    deptho = open_asset(name[model]["deptho"], "static").deptho
 
     if interp_thetao:
         thetao = thetao.interp(time=zos.time, method="quadratic")
@@ -498,16 +570,7 @@ def open_copernicus_zarr(
         .assign(depth=lambda ds: abs(ds["depth"]))
         .isel(depth=slice(None, None, -1))
         # assign dynamic depth and bathymetry
-        .assign(
-            {
-                "dynamic_depth": lambda ds: (ds["depth"] + ds["XE"]).assign_attrs(
-                    {"units": "m", "positive": "down"}
-                ),
-                "dynamic_bathymetry": lambda ds: (ds["H0"] + ds["XE"]).assign_attrs(
-                    {"units": "m", "positive": "down"}
-                ),
-            }
-        )
+        .pipe(_assign_dynamic_depth)
         .pipe(broadcast_variables, {"lat": "latitude", "lon": "longitude"})
     )
 
@@ -1,3 +1,4 @@
+import dask
 import numpy as np
 import xarray as xr
 
@@ -33,6 +34,31 @@ def test_diff_z_numba():
     np.testing.assert_allclose(result, expected, rtol=1e-5)
 
 
+def test_diff_z_numba_nearest_depth():
+    """
+    Test that diff_z_numba matches each tag depth to the nearest model depth, even if
+    the model profile is not sorted and tag depths fall between model levels.
+
+    Model (unsorted):
+      depth: [2.0, 0.5, 2.5, 1.0, 1.5]
+      temp:  [25, 10, 30, 15, 20]
+
+    Tag:
+      depth: [0.1, 1.2, 1.4, 3.0, nan]
+      temp:  [11, 16, 21, 31, 100]
+
+    The nearest model depths are [0.5, 1.0, 1.5, 2.5], yielding diffs of
+    [1, 1, 1, 1] (the nan depth is skipped) → mean = 1.
+    """
+    model_depth = np.array([2.0, 0.5, 2.5, 1.0, 1.5], dtype=np.float64)
+    model_temp = np.array([25, 10, 30, 15, 20], dtype=np.float64)
+    tag_depth = np.array([0.1, 1.2, 1.4, 3.0, np.nan], dtype=np.float64)
+    tag_temp = np.array([11, 16, 21, 31, 100], dtype=np.float64)
+
+    result = diff_z_numba(model_temp, model_depth, 4.0, tag_temp, tag_depth, 0.0)
+    np.testing.assert_allclose(result, 1.0, rtol=1e-5)
+
+
 def test_diff_z():
     """
     Test diff_z via xr.apply_ufunc.
@@ -79,3 +105,33 @@ def test_diff_z():
     assert "diff" in result
     np.testing.assert_allclose(result["diff"].values, expected, rtol=1e-5)
     assert result["diff"].attrs["units"] == "degC"
+
+
+def test_diff_z_chunked():
+    """
+    Test that diff_z gives the same result on chunked model data, computed with the
+    threaded scheduler, as on in-memory data.
+    """
+    rng = np.random.default_rng(0)
+    depth = np.array([0.5, 1.0, 1.5, 2.0, 2.5], dtype=np.float64)
+    model = xr.Dataset(
+        {
+            "TEMP": (("cells", "depth"), rng.normal(15, 5, size=(200, 5))),
+            "dynamic_depth": (("cells", "depth"), np.broadcast_to(depth, (200, 5))),
+            "dynamic_bathymetry": ("cells", np.full(200, 2.5)),
+        },
+        coords={"depth": depth},
+    )
+    model["TEMP"].attrs["units"] = "degC"
+    tag = xr.Dataset(
+        {
+            "temperature": ("obs", np.array([14, 19, 24], dtype=np.float64)),
+            "pressure": ("obs", np.array([1.0, 1.5, 2.0], dtype=np.float64)),
+        },
+    )
+
+    expected = diff_z(model, tag, depth_threshold=0.8)
+    with dask.config.set(scheduler="threads"):
+        actual = diff_z(model.chunk(cells=20), tag, depth_threshold=0.8).compute()
+
+    xr.testing.assert_identical(actual, expected)
@@ -94,6 +94,52 @@ def test_eager_estimator_predict_proba(sample_dataset, predictor_factory, sigma)
     ), "The sum for each time step should be 1."
 
 
+@pytest.mark.parametrize(
+    ["dtype", "expected"], [(None, "float64"), ("float32", "float32")]
+)
+def test_eager_estimator_predict_proba_dtype(
+    sample_dataset, predictor_factory, dtype, expected
+):
+    """
+    Test that `predict_proba` keeps the dtype of the emission probabilities by default.
+    """
+    estimator = EagerEstimator(
+        predictor_factory=predictor_factory, sigma=0.005, dtype=dtype
+    )
+    state_probabilities = estimator.predict_proba(sample_dataset)
+
+    assert state_probabilities.dtype == expected
+
+
+def test_eager_estimator_predict_proba_transposed(sample_dataset, predictor_factory):
+    """
+    Test that `predict_proba` does not depend on the order of the dimensions.
+    """
+    estimator = EagerEstimator(predictor_factory=predictor_factory, sigma=0.005)
+    expected = estimator.predict_proba(sample_dataset)
+
+    transposed = sample_dataset.transpose("cells", "time")
+    actual = estimator.predict_proba(transposed)
+
+    assert actual.dims == transposed["pdf"].dims
+    xr.testing.assert_allclose(actual, expected.transpose(*actual.dims))
+
+
+def test_eager_estimator_reuses_predictor(sample_dataset, predictor_factory):
+    """
+    Test that the predictor is constructed once and not reported as a parameter.
+    """
+    estimator = EagerEstimator(predictor_factory=predictor_factory, sigma=0.0002)
+    estimator.score(sample_dataset)
+    predictor = estimator.predictor
+
+    estimator.predict_proba(sample_dataset)
+    assert estimator.predictor is predictor, "The predictor should be reused."
+    assert estimator.to_dict() == {"sigma": 0.0002, "dtype": None}
+
+    assert estimator.set_params(sigma=0.0004).predictor is None
+
+
 @pytest.mark.parametrize("bounds", [(1e-4, 1), (1, 5), (0.1, 10)])
 @pytest.mark.parametrize("tolerance", [1e-3, 1e-6])
 def test_eager_bounds_search(sample_dataset, predictor_factory, bounds, tolerance):
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pangeo_fish.hmm.filter import backward, forward, forward_backward
+from pangeo_fish.hmm.prediction import Gaussian2DCartesian
+
+
+@pytest.fixture
+def cartesian_case():
+    """
+    Create emission probabilities on a small cartesian grid with masked cells
+    """
+    rng = np.random.default_rng(seed=0)
+    shape = (12, 10)
+
+    mask = np.ones(shape, dtype=bool)
+    mask[:3, :4] = False
+    mask[7:, 6] = False
+
+    emission = rng.random(size=(8,) + shape)
+    initial = np.zeros(shape)
+    initial[5, 5] = 0.7
+    initial[6, 4] = 0.3
+
+    return emission, initial, mask
+
+
+@pytest.mark.parametrize(
+    ["dtype", "tolerances"],
+    (
+        (None, {"rtol": 1e-12, "atol": 1e-15}),
+        ("float32", {"rtol": 1e-4, "atol": 1e-7}),
+    ),
+)
+def test_forward_backward(cartesian_case, dtype, tolerances):
+    """
+    Test that the fused forward_backward matches running forward and backward
+    """
+    emission, initial, mask = cartesian_case
+    predictor = Gaussian2DCartesian(sigma=1.5)
+
+    predictions, states = forward(
+        emission=emission, predictor=predictor, initial_probability=initial, mask=mask
+    )
+    _, expected = backward(states=states, predictions=predictions, predictor=predictor)
+
+    actual = forward_backward(
+        emission=emission,
+        predictor=predictor,
+        initial_probability=initial,
+        mask=mask,
+        dtype=dtype,
+    )
+
+    assert actual.dtype == np.dtype(dtype if dtype is not None else "float64")
+    np.testing.assert_array_equal(actual[:, ~mask], 0)
+    np.testing.assert_allclose(actual, expected, **tolerances)
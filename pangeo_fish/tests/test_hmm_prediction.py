@@ -0,0 +1,44 @@
+import dask.array as da
+import numpy as np
+import pytest
+import scipy.ndimage
+
+from pangeo_fish.hmm.prediction import Gaussian2DCartesian
+
+
+@pytest.mark.parametrize("chunked_mask", [False, True])
+@pytest.mark.parametrize("sigma", [0.7, 2.5])
+def test_gaussian_2d_cartesian(sigma, chunked_mask):
+    """
+    Test that the separable filter of Gaussian2DCartesian matches scipy's gaussian_filter
+    """
+    rng = np.random.default_rng(seed=0)
+    X = rng.random(size=(20, 15))
+    mask = rng.random(size=X.shape) > 0.2
+
+    expected = np.where(
+        mask, scipy.ndimage.gaussian_filter(X, sigma=sigma, mode="constant", cval=0), 0
+    )
+
+    predictor = Gaussian2DCartesian(sigma=sigma)
+    actual = predictor.predict(
+        X, mask=da.from_array(mask, chunks=(10, 5)) if chunked_mask else mask
+    )
+
+    if chunked_mask:
+        assert isinstance(actual, da.Array)
+    np.testing.assert_allclose(np.asarray(actual), expected, rtol=1e-12)
+
+
+def test_gaussian_2d_cartesian_masked_non_finite():
+    """
+    Test that masked cells are zero even if the filtered values are not finite
+    """
+    X = np.zeros((5, 5))
+    X[0, 0] = np.inf
+    mask = np.ones(X.shape, dtype=bool)
+    mask[:2, :2] = False
+
+    actual = Gaussian2DCartesian(sigma=1).predict(X, mask=mask)
+
+    np.testing.assert_array_equal(actual[~mask], 0)
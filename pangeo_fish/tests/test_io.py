@@ -1,9 +1,11 @@
+import io
 import json
 
 import fsspec
+import pandas as pd
 import pytest
 
-from pangeo_fish.io import open_tag
+from pangeo_fish.io import open_tag, read_stations, tz_convert
 
 
 @pytest.fixture
@@ -51,3 +53,96 @@ def test_open_tag(dummy_mapper):
     assert tag["/"].attrs.get("dummy_key") == "dummy_value"
     assert tag["dst/temperature"].sel(time="2022-06-13T00:00:00").item() == 20.0
     assert tag["dst/temperature"].sel(time="2022-06-13T01:00:00").item() == 21.0
+    assert tag["tagging_events/time"].isel(event_name=0).item() == pd.Timestamp(
+        "2022-06-13T11:40:30"
+    )
+
+    # the same resolution as dates parsed by pandas' own csv parser
+    expected_dtype = pd.to_datetime(["2022-06-13T00:00:00"]).dtype
+    assert tag["dst/time"].dtype == expected_dtype
+    assert tag["tagging_events/time"].dtype == expected_dtype
+    assert tag["stations/deploy_time"].dtype == expected_dtype
+    assert tag["acoustic/time"].dtype == expected_dtype
+
+
+def test_open_tag_optional_files(dummy_mapper):
+    """
+    Test opening a tag without stations and acoustic detections
+    """
+    del dummy_mapper["stations.csv"]
+    del dummy_mapper["tag_dummy/acoustic.csv"]
+
+    tag = open_tag(dummy_mapper, "tag_dummy")
+    assert set(tag.keys()) == {"dst", "tagging_events"}
+    assert tag["/"].attrs.get("dummy_key") == "dummy_value"
+
+
+def test_tz_convert():
+    """
+    Test converting the timezones of dataframe columns without modifying the input
+    """
+    df = pd.DataFrame(
+        {
+            "deploy_time": pd.to_datetime(["2022-06-12T12:00:00+02:00"]),
+            "recover_time": pd.to_datetime(["2022-06-20T12:00:00+00:00"]),
+            "station_name": ["station_1"],
+        }
+    )
+
+    actual = tz_convert(df, {"deploy_time": None, "recover_time": "Europe/Paris"})
+
+    assert actual["deploy_time"].dt.tz is None
+    assert actual["deploy_time"].iloc[0] == pd.Timestamp("2022-06-12T10:00:00")
+    assert str(actual["recover_time"].dt.tz) == "Europe/Paris"
+    assert actual["recover_time"].iloc[0] == pd.Timestamp("2022-06-20T12:00:00+00:00")
+    pd.testing.assert_series_equal(actual["station_name"], df["station_name"])
+
+    assert df["deploy_time"].dt.tz is not None, "The input should not be modified."
+
+
+def _empty_listing(path, **kwargs):
+    return []
+
+
+def _missing_listing(path, **kwargs):
+    raise FileNotFoundError(path)
+
+
+@pytest.mark.parametrize("ls", [_empty_listing, _missing_listing])
+def test_open_tag_without_listing(dummy_mapper, monkeypatch, ls):
+    """
+    Test opening a tag where the directory can't be listed, like on http servers
+    without index pages or buckets without list permissions
+    """
+    monkeypatch.setattr(dummy_mapper.fs, "ls", ls)
+
+    tag = open_tag(dummy_mapper, "tag_dummy")
+    assert set(tag.keys()) == {"dst", "tagging_events", "stations", "acoustic"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(
+            b"deployment_id,station_name,deploy_time,recover_time\n"
+            b"28689,station_1,2022-06-12T12:00:00+02:00,2022-06-20T12:00:00+00:00\n",
+            id="well-formed",
+        ),
+        pytest.param(
+            b"""deployment_id,station_name,deploy_time,recover_time
+    28689,station_1,2022-06-12T12:00:00+02:00,2022-06-20T12:00:00+00:00
+    """,
+            id="whitespace",
+        ),
+    ],
+)
+def test_read_stations(content):
+    """
+    Test reading stations, with or without surrounding whitespace
+    """
+    stations = read_stations(io.BytesIO(content))
+
+    expected_dtype = pd.to_datetime(["2022-06-12T12:00:00"]).dtype
+    assert stations["deploy_time"].dtype == expected_dtype
+    assert stations["recover_time"].dtype == expected_dtype
+    assert stations["deploy_time"].iloc[0] == pd.Timestamp("2022-06-12T10:00:00")